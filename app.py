@@ -1,5 +1,7 @@
+from collections import namedtuple
+
+import numpy as np
 import streamlit as st
-import pandas as pd
 
 # ---------------------------------------------------------
 # Steel vs Aluminium Structural Material Selection Tool
@@ -13,77 +15,197 @@ st.write("Now interactive: users enter data → the app calculates using formula
 # -----------------------------
 # Material property data
 # -----------------------------
-steel = {
-    "name": "Steel",
-    "tensile_strength": 400,      # MPa
-    "yield_strength": 250,        # MPa
-    "E": 200,                     # GPa
-    "density": 7850,              # kg/m3
-    "cost": 3.0,                  # RM/kg
-    "corrosion_rating": 2         # /5
-}
-
-aluminum = {
-    "name": "Aluminium",
-    "tensile_strength": 310,      # MPa
-    "yield_strength": 275,        # MPa
-    "E": 69,                      # GPa
-    "density": 2700,              # kg/m3
-    "cost": 12.0,                 # RM/kg
-    "corrosion_rating": 5         # /5
-}
+# One entry per material (same order as MATERIAL_NAMES) so both are
+# evaluated in a single vectorised pass. Unit conversions and products are
+# folded once here, not on every click.
+MATERIAL_NAMES = ("Steel", "Aluminium")
+
+MaterialArrays = namedtuple("MaterialArrays", [
+    "tensile_strength_MPa", "sigma_y_MPa", "E_Pa", "density", "cost", "rho_cost", "corrosion_rating"
+])
+
+@st.cache_resource
+def _materials():
+    # Built once per server process; every rerun gets the same arrays back
+    density = np.array([7850.0, 2700.0])   # kg/m3
+    cost = np.array([3.0, 12.0])           # RM/kg
+    mat = MaterialArrays(
+        tensile_strength_MPa=np.array([400.0, 310.0]),  # MPa
+        sigma_y_MPa=np.array([250.0, 275.0]),           # MPa
+        E_Pa=np.array([200e9, 69e9]),                   # Pa
+        density=density,
+        cost=cost,
+        rho_cost=density * cost,                        # RM/m3
+        corrosion_rating=np.array([2, 5])               # /5
+    )
+    # Shared by every session/thread: an in-place op must not leak across users
+    for arr in mat:
+        arr.setflags(write=False)
+    return mat
+
+MAT = _materials()
 
 # ---------------------------------------------------------
 # Helper calculation functions (beam formulas from slides)
 # ---------------------------------------------------------
-def beam_udl_calculations(L, w_kN_m, b, h, mat):
-    # Convert
-    w = w_kN_m * 1000.0  # N/m
-
-    # Step 1: Mmax
-    Mmax = (w * (L**2)) / 8.0  # N·m
-
-    # Step 2: I
-    I = (b * (h**3)) / 12.0  # m^4
-
-    # Step 3: stress sigma = M*c/I
-    c = h / 2.0
-    sigma = (Mmax * c) / I  # Pa
-    sigma_MPa = sigma / 1e6
-
-    # Material properties
-    E = mat["E"] * 1e9  # Pa
-    sigma_y = mat["yield_strength"]  # MPa
-
-    # Step 4: FOS
-    fos = sigma_y / sigma_MPa if sigma_MPa > 0 else float("inf")
+def _volume(L, b, h):
+    return b * h * L  # m3
+
+def make_beam(mat):
+    # Specialise the beam formulas to one material table: its arrays (and the
+    # E-dependent deflection factor) are bound as closure constants, so a call
+    # does no attribute lookups or unit conversions. Inputs may be scalars or
+    # arrays with a trailing length-1 material axis (see sweep_beam).
+    sigma_y_MPa = mat.sigma_y_MPa
+    density = mat.density
+    rho_cost = mat.rho_cost
+    defl_mm_factor = (5.0 * 1000.0) / (384.0 * mat.E_Pa)  # 5/(384E), m → mm
+
+    def beam(L, w_kN_m, b, h):
+        # Convert
+        w = w_kN_m * 1000.0  # N/m
+
+        # Step 1: Mmax
+        Mmax = (w * (L * L)) / 8.0  # N·m
+
+        # Step 2: I
+        I = (b * (h * h * h)) / 12.0  # m^4
+
+        # Step 3: stress sigma = M*c/I
+        c = h / 2.0
+        sigma = (Mmax * c) / I  # Pa
+        sigma_MPa = sigma / 1e6
+
+        # Step 4: FOS (no load → zero stress → infinite FOS)
+        with np.errstate(divide="ignore"):
+            fos = sigma_y_MPa / sigma_MPa
+
+        # Step 5: Deflection
+        delta_mm = defl_mm_factor * (w * ((L * L) * (L * L))) / I  # mm
+
+        # Step 6: Deflection limit (L/360)
+        delta_allow = (L / 360.0) * 1000.0  # mm
+
+        # Step 7/8/9: Volume, Mass & Cost
+        V = _volume(L, b, h)
+        mass = V * density  # kg
+        total_cost = V * rho_cost  # RM
+
+        return {
+            "Mmax": Mmax,
+            "I": I,
+            "sigma": sigma_MPa,
+            "fos": fos,
+            "delta_mm": delta_mm,
+            "delta_allow_mm": delta_allow,
+            "pass": delta_mm <= delta_allow,
+            "V": V,
+            "mass": mass,
+            "cost": total_cost
+        }
+
+    return beam
+
+_beam = make_beam(MAT)
+
+@st.cache_data(max_entries=256)
+def all_metrics(L, w_kN_m, b, h):
+    # One fused pass for everything Applications 1-3 display. Each value is
+    # either a scalar or an array ordered like MATERIAL_NAMES.
+    m = _beam(L, w_kN_m, b, h)
+
+    # Pre-formatted for Applications 2/3 so cache hits skip float formatting
+    m["mass_str"] = tuple(f"{x:.2f}" for x in m["mass"])
+    m["cost_str"] = tuple(f"{x:.2f}" for x in m["cost"])
+    return m
+
+def _fmt(v, spec=".3g"):
+    return str(v) if isinstance(v, (bool, np.bool_)) else format(v, spec)
+
+def sweep_beam(L_arr, w_arr, b_arr, h_arr):
+    # Evaluate every (L, w, b, h) combination in one broadcast pass. Results
+    # have shape (len(L_arr), len(w_arr), len(b_arr), len(h_arr), n_materials).
+    L, w, b, h = (g[..., np.newaxis] for g in np.ix_(L_arr, w_arr, b_arr, h_arr))
+    m = _beam(L, w, b, h)
+    shape = m["pass"].shape
+    return {
+        "pass": m["pass"],
+        "fos": np.broadcast_to(m["fos"], shape),
+        "mass": np.broadcast_to(m["mass"], shape),
+        "cost": np.broadcast_to(m["cost"], shape)
+    }
 
-    # Step 5: Deflection
-    delta = (5 * w * (L**4)) / (384 * E * I)  # m
-    delta_mm = delta * 1000.0
+def best_sections(L, w_kN_m, b_arr, h_arr):
+    # Cheapest (b, h) per material that passes deflection AND bending strength
+    # (FOS >= 1). One (b, h, fos, mass, cost) tuple per material, or None.
+    s = sweep_beam(np.array([L]), np.array([w_kN_m]), b_arr, h_arr)
+    ok_all = s["pass"] & (s["fos"] >= 1.0)
+    cost = np.where(ok_all, s["cost"], np.inf)[0, 0]  # (n_b, n_h, n_materials)
+
+    best = []
+    for i in range(len(MATERIAL_NAMES)):
+        ib, ih = np.unravel_index(np.argmin(cost[..., i]), cost.shape[:2])
+        if np.isfinite(cost[ib, ih, i]):
+            best.append((b_arr[ib], h_arr[ih], s["fos"][0, 0, ib, ih, i], s["mass"][0, 0, ib, ih, i], cost[ib, ih, i]))
+        else:
+            best.append(None)
+    return best
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def optimize_section(L, w_kN_m, b, h, n=10):
+    # Sweep b and h from half to double the entered section at fixed L and w
+    b_arr = np.linspace(0.5 * b, 2.0 * b, n)
+    h_arr = np.linspace(0.5 * h, 2.0 * h, n)
+
+    table = {"Material": list(MATERIAL_NAMES), "b(m)": [], "h(m)": [], "FOS": [], "Mass(kg)": [], "Cost(RM)": []}
+    for sec in best_sections(L, w_kN_m, b_arr, h_arr):
+        if sec is None:
+            for col, val in (("b(m)", "-"), ("h(m)", "-"), ("FOS", "-"), ("Mass(kg)", "-"), ("Cost(RM)", "no passing section")):
+                table[col].append(val)
+            continue
+        sb, sh, fos, mass, cost = sec
+        table["b(m)"].append(_fmt(sb))
+        table["h(m)"].append(_fmt(sh))
+        table["FOS"].append(_fmt(fos))
+        table["Mass(kg)"].append(f"{mass:.2f}")
+        table["Cost(RM)"].append(f"{cost:.2f}")
+    return table
+
+def _results_table(m):
+    # m is an all_metrics() result, passed in so callers do one cache lookup.
+    # Metric -> (value, format); money and mass match Applications 2/3
+    rows = {
+        "Mmax(Nm)": (m["Mmax"], ".1f"),
+        "I(m4)": (m["I"], ".3g"),
+        "Stress(MPa)": (m["sigma"], ".3g"),
+        "FOS": (m["fos"], ".3g"),
+        "Deflection(mm)": (m["delta_mm"], ".3g"),
+        "Allowable(mm)": (m["delta_allow_mm"], ".3g"),
+        "PASS?": (m["pass"], None),
+        "Volume(m3)": (m["V"], ".3g"),
+        "Mass(kg)": (m["mass"], ".2f"),
+        "Cost(RM)": (m["cost"], ".2f")
+    }
 
-    # Step 6: Deflection limit (L/360)
-    delta_allow = (L / 360.0) * 1000.0  # mm
+    # Rows = metrics, one column per material; st.table takes this dict as is
+    table = {"Metric": list(rows)}
+    for i, name in enumerate(MATERIAL_NAMES):
+        table[name] = [_fmt(np.broadcast_to(v, MAT.density.shape)[i], spec) for v, spec in rows.values()]
+    return table
 
-    # Step 7/8: Volume & Mass
-    V = b * h * L
-    mass = mat["density"] * V
+# Recommendation wording per winning material (same order as MATERIAL_NAMES)
+_FAIL_REASONS = ("Aluminium fails deflection/serviceability", "Steel fails deflection/serviceability")
+_COST_REASONS = ("more cost-effective", "lighter / may be preferred if weight is priority")
 
-    # Step 9: Cost
-    total_cost = mass * mat["cost"]
+@st.cache_data(max_entries=512, ttl=3600, show_spinner=False)
+def recommend(L, w_kN_m, b, h):
+    m = all_metrics(L, w_kN_m, b, h)
 
-    return {
-        "Mmax(Nm)": Mmax,
-        "I(m4)": I,
-        "Stress(MPa)": sigma_MPa,
-        "FOS": fos,
-        "Deflection(mm)": delta_mm,
-        "Allowable(mm)": delta_allow,
-        "PASS?": delta_mm <= delta_allow,
-        "Volume(m3)": V,
-        "Mass(kg)": mass,
-        "Cost(RM)": total_cost
-    }
+    # Decide winner: MUST pass deflection + lower cost / better FOS.
+    # Passing materials sort first, then the cheaper one
+    winner = int(np.lexsort((m["cost"], ~m["pass"]))[0])
+    reason = (_FAIL_REASONS if m["pass"].sum() == 1 else _COST_REASONS)[winner]
+    return _results_table(m), f"✅ Final Recommendation: **{MATERIAL_NAMES[winner].upper()}** ({reason})."
 
 # ---------------------------------------------------------
 # Application 1: Beam Design (UDL) → FULL FORMULAS
@@ -92,38 +214,25 @@ def application_1_beam_udl():
     st.subheader("Application 1: Beam Design (Simply Supported Beam + UDL)")
     st.write("User enters beam and load data. The tool calculates results for steel and aluminium and recommends the better one.")
 
-    L = st.number_input("Beam span, L (m)", value=6.0, min_value=0.1)
-    w = st.number_input("UDL load, w (kN/m)", value=12.0, min_value=0.0)
-    b = st.number_input("Beam width, b (m)", value=0.10, min_value=0.001)
-    h = st.number_input("Beam height, h (m)", value=0.20, min_value=0.001)
+    with st.form(key="form_1"):
+        L = st.number_input("Beam span, L (m)", value=6.0, min_value=0.1)
+        w = st.number_input("UDL load, w (kN/m)", value=12.0, min_value=0.0)
+        b = st.number_input("Beam width, b (m)", value=0.10, min_value=0.001)
+        h = st.number_input("Beam height, h (m)", value=0.20, min_value=0.001)
+        optimize = st.checkbox("Optimize section (sweep b and h from 0.5× to 2×; must pass deflection and FOS ≥ 1)")
 
-    if st.button("Run Beam Calculations ✅"):
-        steel_res = beam_udl_calculations(L, w, b, h, steel)
-        alu_res = beam_udl_calculations(L, w, b, h, aluminum)
+        submitted = st.form_submit_button("Run Beam Calculations ✅")
 
-        df = pd.DataFrame({
-            "Metric": list(steel_res.keys()),
-            "Steel": list(steel_res.values()),
-            "Aluminium": list(alu_res.values())
-        })
-        st.dataframe(df, hide_index=True)
+    if submitted:
+        res, recommendation = recommend(L, w, b, h)
+        st.table(res)
 
-        # Decide winner: MUST pass deflection + lower cost / better FOS
         st.markdown("### ✅ Decision / Recommendation")
+        st.success(recommendation)
 
-        steel_pass = steel_res["PASS?"]
-        alu_pass = alu_res["PASS?"]
-
-        if steel_pass and not alu_pass:
-            st.success("✅ Final Recommendation: **STEEL** (Aluminium fails deflection/serviceability).")
-        elif alu_pass and not steel_pass:
-            st.success("✅ Final Recommendation: **ALUMINIUM** (Steel fails deflection/serviceability).")
-        else:
-            # Both pass or both fail → choose by cost then deflection
-            if steel_res["Cost(RM)"] < alu_res["Cost(RM)"]:
-                st.success("✅ Final Recommendation: **STEEL** (more cost-effective).")
-            else:
-                st.success("✅ Final Recommendation: **ALUMINIUM** (lighter / may be preferred if weight is priority).")
+        if optimize:
+            st.markdown("### 🔍 Cheapest Section (passes deflection and bending, FOS ≥ 1)")
+            st.table(optimize_section(L, w, b, h))
 
 # ---------------------------------------------------------
 # Application 2: Weight-based (user inputs geometry)
@@ -132,17 +241,20 @@ def application_2_weight():
     st.subheader("Application 2: Weight-Based Selection (User Input)")
     st.write("Enter the beam dimensions. The app calculates mass for steel and aluminium.")
 
-    L = st.number_input("Length L (m)", value=6.0, min_value=0.1)
-    b = st.number_input("Width b (m)", value=0.10, min_value=0.001)
-    h = st.number_input("Height h (m)", value=0.20, min_value=0.001)
+    with st.form(key="form_2"):
+        L = st.number_input("Length L (m)", value=6.0, min_value=0.1)
+        b = st.number_input("Width b (m)", value=0.10, min_value=0.001)
+        h = st.number_input("Height h (m)", value=0.20, min_value=0.001)
+
+        submitted = st.form_submit_button("Run Weight Comparison ✅")
 
-    if st.button("Run Weight Comparison ✅"):
-        V = b * h * L
-        ms = steel["density"] * V
-        ma = aluminum["density"] * V
+    if submitted:
+        m = all_metrics(L, 0.0, b, h)
+        ms, ma = m["mass"]
+        ms_str, ma_str = m["mass_str"]
 
-        st.write(f"Steel Mass = {ms:.2f} kg")
-        st.write(f"Aluminium Mass = {ma:.2f} kg")
+        st.write(f"Steel Mass = {ms_str} kg")
+        st.write(f"Aluminium Mass = {ma_str} kg")
 
         if ma < ms:
             st.success("✅ Recommendation: **ALUMINIUM** (lighter → better for weight reduction).")
@@ -156,17 +268,20 @@ def application_3_cost():
     st.subheader("Application 3: Cost-Based Selection (User Input)")
     st.write("Enter beam dimensions. The app estimates total cost using mass × cost/kg.")
 
-    L = st.number_input("Length L (m)", value=6.0, min_value=0.1)
-    b = st.number_input("Width b (m)", value=0.10, min_value=0.001)
-    h = st.number_input("Height h (m)", value=0.20, min_value=0.001)
+    with st.form(key="form_3"):
+        L = st.number_input("Length L (m)", value=6.0, min_value=0.1)
+        b = st.number_input("Width b (m)", value=0.10, min_value=0.001)
+        h = st.number_input("Height h (m)", value=0.20, min_value=0.001)
 
-    if st.button("Run Cost Comparison ✅"):
-        V = b * h * L
-        steel_cost = (steel["density"] * V) * steel["cost"]
-        alu_cost = (aluminum["density"] * V) * aluminum["cost"]
+        submitted = st.form_submit_button("Run Cost Comparison ✅")
 
-        st.write(f"Steel Estimated Cost = RM {steel_cost:.2f}")
-        st.write(f"Aluminium Estimated Cost = RM {alu_cost:.2f}")
+    if submitted:
+        m = all_metrics(L, 0.0, b, h)
+        steel_cost, alu_cost = m["cost"]
+        steel_cost_str, alu_cost_str = m["cost_str"]
+
+        st.write(f"Steel Estimated Cost = RM {steel_cost_str}")
+        st.write(f"Aluminium Estimated Cost = RM {alu_cost_str}")
 
         if steel_cost < alu_cost:
             st.success("✅ Recommendation: **STEEL** (cheaper).")
@@ -178,9 +293,12 @@ def application_3_cost():
 # ---------------------------------------------------------
 def application_4_corrosion():
     st.subheader("Application 4: Corrosion Resistance Selection")
-    env = st.selectbox("Select environment:", ["Indoor (dry)", "Outdoor (normal)", "Coastal / Corrosive"])
+    with st.form(key="form_4"):
+        env = st.selectbox("Select environment:", ["Indoor (dry)", "Outdoor (normal)", "Coastal / Corrosive"])
+
+        submitted = st.form_submit_button("Run Corrosion Recommendation ✅")
 
-    if st.button("Run Corrosion Recommendation ✅"):
+    if submitted:
         if env == "Coastal / Corrosive":
             st.success("✅ Recommendation: **ALUMINIUM** (better corrosion resistance).")
         else:
@@ -191,12 +309,32 @@ def application_4_corrosion():
 # ---------------------------------------------------------
 def application_5_element():
     st.subheader("Application 5: Structural Element Recommendation (With Priority)")
-    element = st.selectbox("Select structural element:", ["Beam", "Column", "Slab", "Truss", "Frame"])
-    priority = st.selectbox("Select main priority:", ["High Strength/Stiffness", "Low Cost", "Low Weight", "High Corrosion Resistance"])
+    with st.form(key="form_5"):
+        element = st.selectbox("Select structural element:", ["Beam", "Column", "Slab", "Truss", "Frame"])
+        priority = st.selectbox("Select main priority:", ["High Strength/Stiffness", "Low Cost", "Low Weight", "High Corrosion Resistance"])
+
+        submitted = st.form_submit_button("Run Element Recommendation ✅")
 
-    if st.button("Run Element Recommendation ✅"):
+    if submitted:
         if priority == "Low Weight":
-            st.success("✅ Recommendation: **ALUMINIUM** (lightweight priority).")
+            st.success(f"✅ Recommendation for {element}: **ALUMINIUM** (lightweight priority).")
         elif priority == "High Corrosion Resistance":
-            st.success("✅ Recommendation: **ALUMINIUM** (better corrosion resistance).")
-        elif priority == "
+            st.success(f"✅ Recommendation for {element}: **ALUMINIUM** (better corrosion resistance).")
+        elif priority == "Low Cost":
+            st.success(f"✅ Recommendation for {element}: **STEEL** (lower material cost).")
+        else:
+            st.success(f"✅ Recommendation for {element}: **STEEL** (higher strength and stiffness).")
+
+# ---------------------------------------------------------
+# Main: application selector (sidebar)
+# ---------------------------------------------------------
+APPLICATIONS = {
+    "Application 1: Beam Design (UDL)": application_1_beam_udl,
+    "Application 2: Weight-Based Selection": application_2_weight,
+    "Application 3: Cost-Based Selection": application_3_cost,
+    "Application 4: Corrosion Resistance": application_4_corrosion,
+    "Application 5: Structural Element Recommendation": application_5_element
+}
+
+choice = st.sidebar.selectbox("Choose an application:", list(APPLICATIONS))
+APPLICATIONS[choice]()
@@ -0,0 +1,44 @@
+import runpy
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+APP = Path(__file__).resolve().parents[1] / "app.py"
+
+
+@pytest.fixture(scope="module")
+def app():
+    # Run the Streamlit script in bare mode to get at its helpers
+    return runpy.run_path(str(APP))
+
+
+@pytest.mark.parametrize("L, w, b, h", [(6.0, 12.0, 0.10, 0.20), (2.0, 300.0, 0.10, 0.20)])
+def test_sweep_matches_scalar_kernel(app, L, w, b, h):
+    s = app["sweep_beam"](np.array([L]), np.array([w]), np.array([b]), np.array([h]))
+    m = app["_beam"](L, w, b, h)
+    for key in ("pass", "fos", "mass", "cost"):
+        np.testing.assert_allclose(s[key][0, 0, 0, 0], m[key])
+
+
+@pytest.mark.parametrize("L, w, b, h", [(6.0, 12.0, 0.10, 0.20), (2.0, 300.0, 0.10, 0.20)])
+def test_best_section_passes_both_rules(app, L, w, b, h):
+    b_arr = np.linspace(0.5 * b, 2.0 * b, 10)
+    h_arr = np.linspace(0.5 * h, 2.0 * h, 10)
+    for i, sec in enumerate(app["best_sections"](L, w, b_arr, h_arr)):
+        assert sec is not None
+        sb, sh, fos, mass, cost = sec
+        m = app["_beam"](L, w, sb, sh)
+        assert m["pass"][i]
+        assert m["fos"][i] >= 1.0
+        assert m["fos"][i] == pytest.approx(fos)
+        assert m["mass"][i] == pytest.approx(mass)
+        assert m["cost"][i] == pytest.approx(cost)
+
+
+def test_no_passing_section(app):
+    b_arr = np.linspace(0.005, 0.02, 10)
+    h_arr = np.linspace(0.005, 0.02, 10)
+    assert app["best_sections"](20.0, 5000.0, b_arr, h_arr) == [None, None]
+    table = app["optimize_section"](20.0, 5000.0, 0.01, 0.01)
+    assert table["Cost(RM)"] == ["no passing section", "no passing section"]